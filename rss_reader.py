@@ -1,71 +1,366 @@
 #!/usr/bin/env python3
-import json
+import asyncio
 import os
 import sys
 import time
 import hashlib
+import mmap
 import re
+import struct
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+import aiohttp
 import feedparser
+import msgspec
+import numpy as np
+import orjson
+import xxhash
+from lxml import etree
 from email.utils import parsedate_tz, mktime_tz
 from typing import List, Dict, Any
 
-import openai
+_TAG_RE = re.compile(r'<[^>]+>')
+_NUMBERED_LINE_RE = re.compile(r'^(\d+)\.\s*(.+)$')
+
+@lru_cache(maxsize=4096)
+def _clean(text: str) -> str:
+    return _TAG_RE.sub('', text).strip()
+
+SYSTEM_MESSAGE = "あなたは日本語翻訳の専門家です。英語のテキストを自然な日本語に翻訳してください。翻訳結果のみを出力してください。"
+BATCH_SYSTEM_MESSAGE = "あなたは日本語翻訳の専門家です。番号付きの英語の各行を自然な日本語に翻訳してください。「番号. 翻訳結果」の形式で、入力と同じ番号を付けて1行ずつ出力し、それ以外は出力しないでください。"
+
+_XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+_FEED_NAMESPACES = (
+    None,
+    'http://www.w3.org/2005/Atom',
+    'http://purl.org/rss/1.0/',
+    'http://my.netscape.com/rdf/simple/0.9/',
+)
+_DC_NAMESPACES = ('http://purl.org/dc/elements/1.1/',)
+
+def _matches(element, name: str, namespaces=_FEED_NAMESPACES) -> bool:
+    if not isinstance(element.tag, str):
+        return False
+    qname = etree.QName(element)
+    return qname.localname == name and qname.namespace in namespaces
+
+def _child_text(element, *names: str, namespaces=_FEED_NAMESPACES) -> str:
+    for name in names:
+        for child in element:
+            if _matches(child, name, namespaces):
+                text = ''.join(child.itertext()).strip()
+                if text:
+                    return text
+    return ''
+
+def _entry_link(element) -> str:
+    link = _child_text(element, 'link')
+    if link:
+        return link
+    for child in element:
+        if (_matches(child, 'link') and child.get('href')
+                and child.get('rel', 'alternate') == 'alternate'):
+            return child.get('href')
+    return ''
+
+def parse_rss_bytes(content: bytes) -> List[Dict[str, str]]:
+    root = etree.fromstring(content, parser=_XML_PARSER)
+    if root is None:
+        return []
+    
+    entries = []
+    for element in root.iter():
+        if _matches(element, 'item') or _matches(element, 'entry'):
+            entries.append({
+                'title': _child_text(element, 'title'),
+                'link': _entry_link(element),
+                'description': _child_text(element, 'description', 'summary', 'content'),
+                'published': (_child_text(element, 'pubDate', 'published')
+                              or _child_text(element, 'date', namespaces=_DC_NAMESPACES)
+                              or _child_text(element, 'updated')),
+            })
+    return entries
+
+class TruncatedResponseError(Exception):
+    def __init__(self, content: str):
+        super().__init__("応答が max_tokens で打ち切られました")
+        self.content = content
 
 class LLMInterface:
-    def __init__(self):
+    def __init__(self, model: str = "gpt-4o-mini"):
+        import openai
+        self.model = model
         self.client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
-    def generate_response(self, prompt, system_message):
-        response = self.client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
+    def _request_params(self, prompt, system_message, model=None):
+        return {
+            "model": model or self.model,
+            "temperature": 0,
+            "max_tokens": min(16384, max(64, len(prompt))),
+            "messages": [
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": prompt}
             ]
-        )
-        return response.choices[0].message.content
+        }
+
+    def generate_response(self, prompt, system_message, model=None):
+        response = self.client.chat.completions.create(**self._request_params(prompt, system_message, model))
+        return self._content_of(response)
+
+    def _content_of(self, response):
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise TruncatedResponseError(choice.message.content or "")
+        return choice.message.content
+
+    async def generate_responses_async(self, prompts, system_message, models=None, concurrency=10):
+        import openai
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with openai.AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY")) as client:
+            async def generate(prompt, model):
+                async with semaphore:
+                    response = await client.chat.completions.create(**self._request_params(prompt, system_message, model))
+                    return self._content_of(response)
+            
+            models = models or [None] * len(prompts)
+            return await asyncio.gather(*[generate(prompt, model) for prompt, model in zip(prompts, models)], return_exceptions=True)
 
 class Translator:
     def __init__(self):
-        self.translation_cache = {}
-        self.cache_file = "translation_cache.json"
+        self.translation_cache = OrderedDict()
+        self.cache_file = "translation_cache.msgpack"
+        self.legacy_cache_file = "translation_cache.json"
+        self.max_cache_entries = 10000
+        self.compact_interval = 100
+        self.mmap_threshold = 64 * 1024
+        self.long_text_model = "gpt-4o"
+        self.long_text_length = 200
+        self._cache_log = None
+        self._log_entries = 0
+        self._writes_since_compact = 0
         self.llm = LLMInterface()
         self.load_translation_cache()
     
     def load_translation_cache(self):
         if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                self.translation_cache = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < self.mmap_threshold:
+                    offset = self._read_frames(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        offset = self._read_frames(view)
+            self._evict()
+            self._cache_log = open(self.cache_file, 'ab')
+            if offset < size or self._log_entries > 2 * len(self.translation_cache):
+                self.compact_cache()
+        elif os.path.exists(self.legacy_cache_file):
+            with open(self.legacy_cache_file, 'rb') as f:
+                self.translation_cache = OrderedDict(orjson.loads(f.read()))
+            self._evict()
+            self.compact_cache()
+        else:
+            self._cache_log = open(self.cache_file, 'ab')
+    
+    def model_for(self, text: str):
+        return self.long_text_model if len(text) >= self.long_text_length else None
+    
+    def _read_frames(self, data) -> int:
+        offset = 0
+        while offset + 4 <= len(data):
+            (length,) = struct.unpack_from('>I', data, offset)
+            entries = self._decode_frame(data, offset + 4, length)
+            if entries is None:
+                break
+            self.translation_cache.update(entries)
+            self._log_entries += len(entries)
+            offset += 4 + length
+        return offset
+    
+    def _decode_frame(self, data, start: int, length: int):
+        frame = data[start:start + length]
+        try:
+            if len(frame) < length:
+                return None
+            entries = msgspec.msgpack.decode(frame)
+        except msgspec.DecodeError:
+            return None
+        finally:
+            if isinstance(frame, memoryview):
+                frame.release()
+            del frame
+        return entries if isinstance(entries, dict) else None
+    
+    def _encode_frame(self, entries: Dict[str, str]) -> bytes:
+        frame = msgspec.msgpack.encode(entries)
+        return struct.pack('>I', len(frame)) + frame
+    
+    def _evict(self):
+        while len(self.translation_cache) > self.max_cache_entries:
+            self.translation_cache.popitem(last=False)
+    
+    def get_cached(self, key: str):
+        value = self.translation_cache.get(key)
+        if value is not None:
+            self.translation_cache.move_to_end(key)
+        return value
     
-    def save_translation_cache(self):
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.translation_cache, f, indent=2, ensure_ascii=False)
+    def add_translations(self, entries: Dict[str, str]):
+        for key, value in entries.items():
+            self.translation_cache[key] = value
+            self.translation_cache.move_to_end(key)
+        self._evict()
+        self.save_translation_cache(entries)
+    
+    def save_translation_cache(self, entries: Dict[str, str]):
+        self._cache_log.write(self._encode_frame(entries))
+        self._cache_log.flush()
+        self._log_entries += len(entries)
+        self._writes_since_compact += 1
+        if (self._log_entries > 2 * len(self.translation_cache)
+                or (self._writes_since_compact >= self.compact_interval
+                    and self._log_entries > len(self.translation_cache))):
+            self.compact_cache()
+    
+    def compact_cache(self):
+        if self._cache_log:
+            self._cache_log.close()
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(self._encode_frame(self.translation_cache))
+        os.replace(tmp_file, self.cache_file)
+        self._cache_log = open(self.cache_file, 'ab')
+        self._log_entries = len(self.translation_cache)
+        self._writes_since_compact = 0
     
     def translate_text(self, text: str) -> str:
-        if not text.strip():
-            return text
+        cached = self.get_cached(text)
+        if cached is not None:
+            return cached
         
-        clean_text = re.sub(r'<[^>]+>', '', text).strip()
+        clean_text = _clean(text)
         if not clean_text:
             return text
         
-        if clean_text in self.translation_cache:
-            return self.translation_cache[clean_text]
+        cached = self.get_cached(clean_text)
+        if cached is not None:
+            return cached
         
         try:
             if not os.environ.get('OPENAI_API_KEY'):
                 return f"[翻訳エラー: API_KEY未設定] {clean_text}"
             
-            system_message = "あなたは日本語翻訳の専門家です。英語のテキストを自然な日本語に翻訳してください。翻訳結果のみを出力してください。"
-            translated = self.llm.generate_response(clean_text, system_message)
+            translated = self.llm.generate_response(clean_text, SYSTEM_MESSAGE, self.model_for(clean_text))
             
-            self.translation_cache[clean_text] = translated
-            self.save_translation_cache()
+            self.add_translations({clean_text: translated})
             return translated
             
         except Exception as e:
             return f"[翻訳エラー] {clean_text}"
+    
+    def _lookup_cached(self, texts: List[str]):
+        results = list(texts)
+        misses = {}
+        
+        for i, text in enumerate(texts):
+            cached = self.get_cached(text)
+            if cached is not None:
+                results[i] = cached
+                continue
+            clean_text = _clean(text)
+            if not clean_text:
+                continue
+            cached = self.get_cached(clean_text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(clean_text, []).append(i)
+        
+        return results, misses
+    
+    def _has_api_key(self) -> bool:
+        return bool(os.environ.get('OPENAI_API_KEY'))
+    
+    def _fill_errors(self, results: List[str], misses: Dict[str, List[int]], message: str) -> List[str]:
+        for clean_text, indices in misses.items():
+            for i in indices:
+                results[i] = f"{message} {clean_text}"
+        return results
+    
+    def _store_translations(self, results: List[str], misses: Dict[str, List[int]], translated: Dict[str, str]) -> List[str]:
+        new_entries = {}
+        for clean_text, indices in misses.items():
+            if clean_text in translated:
+                new_entries[clean_text] = translated[clean_text]
+                value = translated[clean_text]
+            else:
+                value = f"[翻訳エラー] {clean_text}"
+            for i in indices:
+                results[i] = value
+        
+        if new_entries:
+            self.add_translations(new_entries)
+        return results
+    
+    def _translate_numbered(self, keys: List[str], model=None) -> Dict[str, str]:
+        lines = "\n".join(f"{n}. {' '.join(key.split())}" for n, key in enumerate(keys, 1))
+        prompt = f"Translate each numbered English line to Japanese, keep numbering:\n{lines}"
+        
+        truncated = False
+        try:
+            response = self.llm.generate_response(prompt, BATCH_SYSTEM_MESSAGE, model)
+        except TruncatedResponseError as e:
+            response = e.content
+            truncated = True
+        except Exception as e:
+            return {}
+        
+        matches = [_NUMBERED_LINE_RE.match(line.strip()) for line in response.splitlines()]
+        matches = [match for match in matches if match and 1 <= int(match.group(1)) <= len(keys)]
+        if truncated:
+            matches = matches[:-1]
+        
+        translated = {}
+        for match in matches:
+            translated.setdefault(keys[int(match.group(1)) - 1], match.group(2))
+        return translated
+    
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        results, misses = self._lookup_cached(texts)
+        if not misses:
+            return results
+        if not self._has_api_key():
+            return self._fill_errors(results, misses, "[翻訳エラー: API_KEY未設定]")
+        
+        keys_by_model = {}
+        for key in misses:
+            keys_by_model.setdefault(self.model_for(key), []).append(key)
+        
+        translated = {}
+        for model, keys in keys_by_model.items():
+            translated.update(self._translate_numbered(keys, model))
+        
+        return self._store_translations(results, misses, translated)
+    
+    def translate_many(self, texts: List[str]) -> List[str]:
+        results, misses = self._lookup_cached(texts)
+        if not misses:
+            return results
+        if not self._has_api_key():
+            return self._fill_errors(results, misses, "[翻訳エラー: API_KEY未設定]")
+        
+        keys = list(misses)
+        responses = asyncio.run(self.llm.generate_responses_async(keys, SYSTEM_MESSAGE, [self.model_for(key) for key in keys]))
+        translated = {
+            clean_text: response
+            for clean_text, response in zip(keys, responses)
+            if not isinstance(response, Exception)
+        }
+        return self._store_translations(results, misses, translated)
 
 class RSSManager:
     def __init__(self, feeds_file: str = "rss_feeds.json"):
@@ -73,17 +368,23 @@ class RSSManager:
         self.feeds = self.load_feeds()
         self.settings_file = "settings.json"
         self.settings = self.load_settings()
-        self.translator = Translator()
+        self._translator = None
+    
+    @property
+    def translator(self) -> Translator:
+        if self._translator is None:
+            self._translator = Translator()
+        return self._translator
     
     def load_feeds(self) -> List[Dict[str, str]]:
         if os.path.exists(self.feeds_file):
-            with open(self.feeds_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.feeds_file, 'rb') as f:
+                return orjson.loads(f.read())
         return []
     
     def save_feeds(self):
-        with open(self.feeds_file, 'w', encoding='utf-8') as f:
-            json.dump(self.feeds, f, indent=2, ensure_ascii=False)
+        with open(self.feeds_file, 'wb') as f:
+            f.write(orjson.dumps(self.feeds, option=orjson.OPT_INDENT_2))
     
     def add_feed(self, url: str, name: str = None):
         if name is None:
@@ -115,13 +416,13 @@ class RSSManager:
     
     def load_settings(self) -> Dict[str, Any]:
         if os.path.exists(self.settings_file):
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {"translation_enabled": False}
     
     def save_settings(self):
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(self.settings, f, indent=2, ensure_ascii=False)
+        with open(self.settings_file, 'wb') as f:
+            f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
     
     def toggle_translation(self):
         self.settings["translation_enabled"] = not self.settings.get("translation_enabled", False)
@@ -143,18 +444,60 @@ class RSSReader:
         self.rss_manager = rss_manager
         self.current_page = 0
         self.items_per_page = 20
+        self.description_length = 500
         self.all_items = []
+        self._timestamps = np.empty(0, dtype=np.int64)
         self.cache_dir = "rss_cache"
+        self.max_connections = 20
+        self.cache_ttl_seconds = 1800
+        self._refresh_thread = None
+        self._refresh_done = threading.Event()
+        self._refreshed_results = []
+        self._refresh_messages = []
+        self._items_by_feed = {}
         
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
     
     def get_cache_filename(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{xxhash.xxh64_hexdigest(url.encode())}.msgpack")
+    
+    def get_validators_filename(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{xxhash.xxh64_hexdigest(url.encode())}.validators.msgpack")
+    
+    def get_legacy_cache_filename(self, url: str) -> str:
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return os.path.join(self.cache_dir, f"{url_hash}.json")
     
+    def migrate_legacy_cache(self, legacy_cache_file: str, cache_file: str):
+        with open(legacy_cache_file, 'rb') as f:
+            cached_data = orjson.loads(f.read())
+        with open(cache_file, 'wb') as f:
+            f.write(msgspec.msgpack.encode(cached_data))
+        st = os.stat(legacy_cache_file)
+        os.utime(cache_file, (st.st_atime, st.st_mtime))
+        os.remove(legacy_cache_file)
+    
     def has_cache(self, cache_file: str) -> bool:
-        return os.path.exists(cache_file)
+        return os.path.exists(cache_file) and (time.time() - os.path.getmtime(cache_file)) < self.cache_ttl_seconds
+    
+    def load_cache(self, cache_file: str, feed: Dict[str, str]) -> List[Dict[str, Any]]:
+        with open(cache_file, 'rb') as f:
+            cached_data = msgspec.msgpack.decode(f.read())
+        for item in cached_data:
+            item['feed_name'] = feed['name']
+        return cached_data
+    
+    def get_conditional_headers(self, cache_file: str, validators_file: str) -> Dict[str, str]:
+        headers = {}
+        if os.path.exists(cache_file) and os.path.exists(validators_file):
+            with open(validators_file, 'rb') as f:
+                validators = msgspec.msgpack.decode(f.read())
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
     
     def parse_date(self, date_str: str) -> float:
         if not date_str:
@@ -165,51 +508,192 @@ class RSSReader:
                 return mktime_tz(parsed)
         except:
             pass
+        try:
+            return int(datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp())
+        except ValueError:
+            pass
         return 0
     
+    def prepare_cache_file(self, feed: Dict[str, str]) -> str:
+        cache_file = self.get_cache_filename(feed['url'])
+        legacy_cache_file = self.get_legacy_cache_filename(feed['url'])
+        if not os.path.exists(cache_file) and os.path.exists(legacy_cache_file):
+            self.migrate_legacy_cache(legacy_cache_file, cache_file)
+        return cache_file
+    
+    async def _fetch_one(self, session: aiohttp.ClientSession, feed: Dict[str, str], verbose: bool = True):
+        try:
+            cache_file = await asyncio.to_thread(self.prepare_cache_file, feed)
+            
+            if self.has_cache(cache_file):
+                if verbose:
+                    print(f"キャッシュから読み込み: {feed['name']}")
+                return feed, await asyncio.to_thread(self.load_cache, cache_file, feed)
+            
+            if verbose:
+                print(f"取得中: {feed['name']}")
+            validators_file = self.get_validators_filename(feed['url'])
+            headers = await asyncio.to_thread(self.get_conditional_headers, cache_file, validators_file)
+            async with session.get(feed['url'], headers=headers) as response:
+                if response.status == 304 and headers:
+                    os.utime(cache_file)
+                    if verbose:
+                        print(f"更新なし: {feed['name']}")
+                    return feed, await asyncio.to_thread(self.load_cache, cache_file, feed)
+                
+                response.raise_for_status()
+                body = await response.read()
+                validators = {
+                    'etag': response.headers.get('ETag', ''),
+                    'last_modified': response.headers.get('Last-Modified', '')
+                }
+            
+            feed_items = await asyncio.to_thread(
+                self.store_feed, feed, body, validators, cache_file, validators_file)
+            return feed, feed_items
+                
+        except Exception as e:
+            self._report(f"フィード '{feed['name']}' の取得でエラー: {e}", verbose)
+            return feed, await asyncio.to_thread(self.load_stale_cache, feed, verbose)
+    
+    def store_feed(self, feed: Dict[str, str], body: bytes, validators: Dict[str, str],
+                   cache_file: str, validators_file: str) -> List[Dict[str, Any]]:
+        feed_items = []
+        for entry in parse_rss_bytes(body):
+            item = {
+                'title': entry['title'] or '無題',
+                'link': entry['link'],
+                'description': entry['description'],
+                'published': entry['published'],
+                'published_timestamp': self.parse_date(entry['published'])
+            }
+            feed_items.append(item)
+        
+        with open(cache_file, 'wb') as f:
+            f.write(msgspec.msgpack.encode(feed_items))
+        for item in feed_items:
+            item['feed_name'] = feed['name']
+        with open(validators_file, 'wb') as f:
+            f.write(msgspec.msgpack.encode(validators))
+        return feed_items
+    
+    def _report(self, message: str, verbose: bool):
+        if verbose:
+            print(message)
+        else:
+            self._refresh_messages.append(message)
+    
+    def load_stale_cache(self, feed: Dict[str, str], verbose: bool = True) -> List[Dict[str, Any]]:
+        cache_file = self.get_cache_filename(feed['url'])
+        if not os.path.exists(cache_file):
+            return []
+        try:
+            cached_data = self.load_cache(cache_file, feed)
+        except Exception as e:
+            self._report(f"フィード '{feed['name']}' のキャッシュ読み込みでエラー: {e}", verbose)
+            return []
+        self._report(f"古いキャッシュを表示します: {feed['name']}", verbose)
+        return cached_data
+    
+    async def _fetch_all_async(self, feeds: List[Dict[str, str]], verbose: bool):
+        timeout = aiohttp.ClientTimeout(total=10)
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            return await asyncio.gather(*[self._fetch_one(session, feed, verbose) for feed in feeds])
+    
+    def _fetch_feeds(self, feeds: List[Dict[str, str]], verbose: bool = True):
+        if not feeds:
+            return []
+        return asyncio.run(self._fetch_all_async(feeds, verbose))
+    
+    def _timestamps_of(self, items: List[Dict[str, Any]]):
+        return np.fromiter((item['published_timestamp'] for item in items), dtype=np.int64, count=len(items))
+    
+    def set_items(self, items: List[Dict[str, Any]]):
+        self.all_items = items
+        self._timestamps = self._timestamps_of(items)
+    
+    def sort_items(self):
+        order = np.argsort(-self._timestamps, kind='stable')
+        self.all_items = [self.all_items[i] for i in order]
+        self._timestamps = self._timestamps[order]
+    
+    def _rebuild_items(self):
+        self.set_items([item for items in self._items_by_feed.values() for item in items])
+        self.sort_items()
+    
     def fetch_all_items(self):
-        self.all_items = []
+        self.wait_for_refresh()
+        print("記事を取得中...")
+        self._items_by_feed = {feed['url']: items for feed, items in self._fetch_feeds(self.rss_manager.feeds)}
+        self._rebuild_items()
+    
+    def load_items(self):
+        self.wait_for_refresh()
+        self._items_by_feed = {}
+        stale_feeds = []
         print("記事を取得中...")
         
         for feed in self.rss_manager.feeds:
             try:
-                cache_file = self.get_cache_filename(feed['url'])
-                
+                cache_file = self.prepare_cache_file(feed)
+                if not os.path.exists(cache_file):
+                    stale_feeds.append(feed)
+                    continue
+                self._items_by_feed[feed['url']] = self.load_cache(cache_file, feed)
                 if self.has_cache(cache_file):
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        cached_data = json.load(f)
-                        for item in cached_data:
-                            item['feed_name'] = feed['name']
-                            self.all_items.append(item)
                     print(f"キャッシュから読み込み: {feed['name']}")
                 else:
-                    print(f"取得中: {feed['name']}")
-                    parsed_feed = feedparser.parse(feed['url'])
-                    feed_items = []
-                    
-                    for entry in parsed_feed.entries:
-                        item = {
-                            'title': entry.get('title', '無題'),
-                            'link': entry.get('link', ''),
-                            'description': entry.get('description', ''),
-                            'published': entry.get('published', ''),
-                            'published_timestamp': self.parse_date(entry.get('published', '')),
-                            'feed_name': feed['name']
-                        }
-                        feed_items.append(item)
-                        self.all_items.append(item)
-                    
-                    with open(cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(feed_items, f, indent=2, ensure_ascii=False)
-                        
+                    stale_feeds.append(feed)
             except Exception as e:
                 print(f"フィード '{feed['name']}' の取得でエラー: {e}")
+                stale_feeds.append(feed)
+        
+        self._rebuild_items()
+        
+        if stale_feeds:
+            print(f"{len(stale_feeds)}件のフィードをバックグラウンドで更新します")
+            self._refresh_done.clear()
+            self._refresh_thread = threading.Thread(target=self._refresh, args=(stale_feeds,), daemon=True)
+            self._refresh_thread.start()
+    
+    def _refresh(self, feeds: List[Dict[str, str]]):
+        try:
+            self._refreshed_results = self._fetch_feeds(feeds, verbose=False)
+        finally:
+            self._refresh_done.set()
+    
+    def is_refreshing(self) -> bool:
+        return self._refresh_thread is not None and not self._refresh_done.is_set()
+    
+    def merge_refreshed_items(self) -> bool:
+        if self._refresh_thread is None or not self._refresh_done.is_set():
+            return False
         
-        self.all_items.sort(key=lambda x: x.get('published_timestamp', 0), reverse=True)
+        self._refresh_thread = None
+        for message in self._refresh_messages:
+            print(message)
+        self._refresh_messages = []
+        for feed, items in self._refreshed_results:
+            self._items_by_feed[feed['url']] = items
+        self._refreshed_results = []
+        self._rebuild_items()
+        self.current_page = min(self.current_page, max(0, (len(self.all_items) - 1) // self.items_per_page))
+        return True
+    
+    def wait_for_refresh(self):
+        if self._refresh_thread is not None:
+            self._refresh_done.wait()
+            self.merge_refreshed_items()
     
     def show_list(self):
+        if not self.all_items and self._refresh_thread is None:
+            self.load_items()
+        
         if not self.all_items:
-            self.fetch_all_items()
+            self.wait_for_refresh()
+        elif self.merge_refreshed_items():
+            print("新しい記事を取得したため一覧を更新しました")
         
         if not self.all_items:
             print("記事がありません")
@@ -221,18 +705,20 @@ class RSSReader:
         
         translation_status = "翻訳ON" if self.rss_manager.settings.get("translation_enabled", False) else "翻訳OFF"
         print(f"\n=== RSS記事一覧 (ページ {self.current_page + 1}) - {translation_status} ===")
+        if self.is_refreshing():
+            print("（最新記事を取得中...）")
         
-        for i, item in enumerate(page_items, start):
-            title = item['title']
-            description = item.get('description', '')
-            
-            if self.rss_manager.settings.get("translation_enabled", False):
-                title = self.rss_manager.translator.translate_text(title)
-                if description:
-                    description = self.rss_manager.translator.translate_text(description)
-            
+        titles = [item['title'] for item in page_items]
+        descriptions = [item.get('description', '')[:self.description_length] for item in page_items]
+        
+        if self.rss_manager.settings.get("translation_enabled", False):
+            translated = self.rss_manager.translator.translate_batch(titles + descriptions)
+            titles = translated[:len(page_items)]
+            descriptions = translated[len(page_items):]
+        
+        for i, (item, title, description) in enumerate(zip(page_items, titles, descriptions), start):
             if description:
-                clean_desc = re.sub(r'<[^>]+>', '', description)[:50]
+                clean_desc = _TAG_RE.sub('', description)[:50]
                 print(f"{i}: [{item['feed_name']}] {title}")
                 print(f"     {clean_desc}...")
             else:
@@ -253,14 +739,15 @@ class RSSReader:
                 print(f"フィード: {item['feed_name']}")
                 print(f"公開日: {item['published']}")
                 print(f"URL: {item['link']}")
-                print(f"\n内容（原文）: {item['description'][:500]}...")
-                print(f"\n内容（翻訳）: {self.rss_manager.translator.translate_text(item['description'][:500])}...")
+                desc_key = item['description'][:self.description_length]
+                print(f"\n内容（原文）: {desc_key}...")
+                print(f"\n内容（翻訳）: {self.rss_manager.translator.translate_text(desc_key)}...")
             else:
                 print(f"タイトル: {item['title']}")
                 print(f"フィード: {item['feed_name']}")
                 print(f"公開日: {item['published']}")
                 print(f"URL: {item['link']}")
-                print(f"内容: {item['description'][:500]}...")
+                print(f"内容: {item['description'][:self.description_length]}...")
             
             print("\nコマンド: b(戻る)")
         else:
@@ -282,6 +769,7 @@ class RSSReader:
             print("最初のページです")
     
     def generate_html(self, output_file: str = "rss_articles.html"):
+        self.wait_for_refresh()
         if not self.all_items:
             self.fetch_all_items()
         
@@ -296,13 +784,20 @@ class RSSReader:
         translation_enabled = self.rss_manager.settings.get("translation_enabled", False)
         articles_html = ""
         
+        if translation_enabled:
+            titles = [item['title'] for item in self.all_items]
+            descriptions = [item.get('description', '') for item in self.all_items]
+            translated = self.rss_manager.translator.translate_many(titles + descriptions)
+            titles_ja = translated[:len(self.all_items)]
+            descriptions_ja = translated[len(self.all_items):]
+        
         for i, item in enumerate(self.all_items):
             title = item['title']
             description = item.get('description', '')
             
             if translation_enabled:
-                title_ja = self.rss_manager.translator.translate_text(title)
-                description_ja = self.rss_manager.translator.translate_text(description) if description else ""
+                title_ja = titles_ja[i]
+                description_ja = descriptions_ja[i]
                 
                 articles_html += f"""
                 <div class="article">